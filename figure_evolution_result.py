@@ -49,7 +49,7 @@ PLOT_FORMAT = 'png'
 # 3.Define function
 # --------------------------------------------------------------------------------
 def draw_convergence_figure(net_name, evo_result):
-    best_idv, fitness_avg, fitness_best = evo_result
+    best_idv, fitness_avg, fitness_best = evo_result[0:3]
 
     # create figure
     fig, ax = plt.subplots(figsize=(PLOT_X_SIZE, PLOT_Y_SIZE), facecolor='w')
@@ -3,7 +3,7 @@ Locus-based Genetic Algorithm (LGA)
 
 @auth: Yu-Hsiang Fu
 @date: 2016/04/28
-@update: 2018/03/26
+@update: 2026/10/19
 """
 # --------------------------------------------------------------------------------
 # 1.Import modular
@@ -12,23 +12,30 @@ Locus-based Genetic Algorithm (LGA)
 import copy as c
 import networkx as nx
 import numpy as np
+import os.path
 import pickle
 import random as r
 
 # import custom-modular
+import util.algorithm.label_propagation as lp
+import util.algorithm.multilevel as ml
 import util.data_structure.disjoint_set as djs
 import util.handler.edgelist_handler as eh
 import util.handler.pickle_handler as ph
 import util.handler.pairvalue_handler as pvh
+import util.measure.partition_similarity as psm
 
 # import folder-constant
 from util.constant.constant_folder import FOLDER_EDGELIST
 from util.constant.constant_folder import FOLDER_FILE
 
 # import graph-constant
+from util.constant.constant_graph import EDGE_WEIGHT
+from util.constant.constant_graph import GRAPH_TOTAL_WEIGHT
 from util.constant.constant_graph import NODE_COMMUNITY
 from util.constant.constant_graph import NODE_DEGREE
 from util.constant.constant_graph import NODE_LAYOUT_XY
+from util.constant.constant_graph import NODE_SELF_WEIGHT
 
 
 # --------------------------------------------------------------------------------
@@ -38,12 +45,37 @@ from util.constant.constant_graph import NODE_LAYOUT_XY
 GENE_TO_NODE = {}
 NODE_TO_GENE = {}
 NEIGHBOR_LIST = {}
+FORCED_GENE = []  # (gene, neighbor_gene) of the forced loci, i.e., degree-1 nodes
+NEIGHBOR_INDPTR = None  # CSR adjacency index of genes
+NEIGHBOR_INDICES = None
+NEIGHBOR_DEGREE = None
 
 # GA variable
-IDV_LENGTH = 0
+NUM_NODE = 0
+IDV_LENGTH = 0  # number of free loci, the forced loci are not evolved
+IS_RANK_ENCODING = False  # gene = rank of the neighbor in the CSR index, instead of gene id
+GENE_RANK_DTYPE = np.uint8
 IDV_FITNESS = 'fitness'
 IDV_GENOTYPE = 'genotype'
 IDV_PHENOTYPE = 'phenotype'
+IDV_NMI = 'nmi'
+IDV_ARI = 'ari'
+
+# evolution record variable
+EVO_DIVERSITY = 'diversity'
+EVO_DISTANCE_BEST = 'distance_best'
+EVO_RATE_CROSSOVER = 'rate_crossover'
+EVO_RATE_MUTATION = 'rate_mutation'
+
+# adaptive rate variable
+ADAPTIVE_DECAY = 0.85
+ADAPTIVE_BOOST = 1.5
+ADAPTIVE_DIVERSITY = 0.05  # distance to the best individual of a converged population
+ADAPTIVE_RATE_CROSSOVER = (0.1, 1.0)  # (min, max)
+ADAPTIVE_RATE_MUTATION = (0.001, 0.5)
+
+# warm start variable
+WARM_START_RATE = 0.5  # rate of the population around the previous solution
 
 
 # --------------------------------------------------------------------------------
@@ -85,15 +117,29 @@ def modularity(g, community_list):
         community_index += 1
 
     # calculate ls, time complexity: O(E)
-    for (ei, ej) in g.edges():
-        if community_id[ei] == community_id[ej]:
-            intra_edges[community_id[ei]] += 1
-        else:
-            pass
+    if GRAPH_TOTAL_WEIGHT in g.graph:
+        # weighted (coarse) graph, including the weight of contracted edges
+        for i in g:
+            intra_edges[community_id[i]] += g.node[i][NODE_SELF_WEIGHT]
+
+        for (ei, ej, w) in g.edges(data=EDGE_WEIGHT, default=1):
+            if community_id[ei] == community_id[ej]:
+                intra_edges[community_id[ei]] += w
+            else:
+                pass
+
+        num_edges = g.graph[GRAPH_TOTAL_WEIGHT]
+    else:
+        for (ei, ej) in g.edges():
+            if community_id[ei] == community_id[ej]:
+                intra_edges[community_id[ei]] += 1
+            else:
+                pass
+
+        num_edges = g.number_of_edges()
 
     # calculate modularity Q, time complexity: O(C)
     q = 0
-    num_edges = g.number_of_edges()
 
     for i in range(0, len(community_list)):
         ls = intra_edges[i] / num_edges
@@ -115,23 +161,89 @@ def generate_genotype():
     #     neighbor_gene = NODE_TO_GENE[neighbor_id]
     #     genotype.append(c.copy(neighbor_gene))
     #
-    genotype = [NODE_TO_GENE[r.choice(NEIGHBOR_LIST[GENE_TO_NODE[i]])] for i in range(0, IDV_LENGTH)]
+    if IS_RANK_ENCODING:
+        genotype = (np.random.random_sample(IDV_LENGTH) * NEIGHBOR_DEGREE[0: IDV_LENGTH]).astype(GENE_RANK_DTYPE)
+    else:
+        genotype = [NODE_TO_GENE[r.choice(NEIGHBOR_LIST[GENE_TO_NODE[i]])] for i in range(0, IDV_LENGTH)]
 
     return genotype
 
 
+def encode_genotype(gene_list):
+    # gene id -> rank of the neighbor
+    if IS_RANK_ENCODING:
+        indptr = NEIGHBOR_INDPTR.tolist()
+        indices = NEIGHBOR_INDICES.tolist()
+        rank_list = [indices[indptr[x]: indptr[x + 1]].index(y) for (x, y) in enumerate(gene_list)]
+
+        return np.array(rank_list, dtype=GENE_RANK_DTYPE)
+    else:
+        return gene_list
+
+
+def decode_genotype(genotype):
+    # rank of the neighbor -> gene id, through the CSR index
+    if IS_RANK_ENCODING:
+        return NEIGHBOR_INDICES[NEIGHBOR_INDPTR[0: IDV_LENGTH] + genotype].tolist()
+    else:
+        return genotype
+
+
+def generate_seeded_genotype(random_state=None):
+    # seed partition: a few sweeps of label propagation
+    labels = lp.label_propagation(NEIGHBOR_INDPTR, NEIGHBOR_INDICES, random_state=random_state).tolist()
+
+    return partition_to_genotype(labels)
+
+
+def partition_to_genotype(labels):
+    # labels: community label of each gene 0..NUM_NODE-1
+    indptr = NEIGHBOR_INDPTR.tolist()
+    indices = NEIGHBOR_INDICES.tolist()
+
+    # spanning forest of each community, a gene points to its parent in the bfs tree
+    genotype = [-1] * NUM_NODE
+    gene_order = list(range(0, NUM_NODE))
+    r.shuffle(gene_order)
+
+    for root in gene_order:
+        if genotype[root] != -1:
+            continue
+
+        genotype[root] = root
+        queue = [root]
+
+        for x in queue:
+            for y in indices[indptr[x]: indptr[x + 1]]:
+                if genotype[y] == -1 and labels[y] == labels[x]:
+                    genotype[y] = x
+                    queue.append(y)
+
+        # root points to a neighbor within its community, if any
+        root_neighbor = indices[indptr[root]: indptr[root + 1]]
+        same_neighbor = [y for y in root_neighbor if labels[y] == labels[root]]
+        genotype[root] = r.choice(same_neighbor if same_neighbor else root_neighbor)
+
+    return encode_genotype(genotype[0: IDV_LENGTH])
+
+
 def generate_phenotype(idv):
     # create disjoint-set
-    ds = djs.disjoint_set(IDV_LENGTH)
+    ds = djs.disjoint_set(NUM_NODE)
+    gene_list = decode_genotype(idv[IDV_GENOTYPE])
 
     for x in range(0, IDV_LENGTH):
-        y = idv[IDV_GENOTYPE][x]
+        y = gene_list[x]
+        ds.union(x, y)
+
+    # reinsert the forced loci
+    for (x, y) in FORCED_GENE:
         ds.union(x, y)
 
     # create community list, map node_index to node_id
     community_list = {}
 
-    for i in range(IDV_LENGTH):
+    for i in range(NUM_NODE):
         node_id = GENE_TO_NODE[i]
         ri = ds.find_set(i)
 
@@ -158,7 +270,7 @@ def generate_two_individuals(idv_pool, rate_crossover=0.5):
 
     if pool_size == 1:
         parent_x = p_deepcopy(idv_pool[0][IDV_GENOTYPE])
-        parent_y = generate_an_individual()
+        parent_y = generate_genotype()
     else:
         parent_index = r.sample(range(0, pool_size), 2)
         parent_x = p_deepcopy(idv_pool[parent_index[0]][IDV_GENOTYPE])
@@ -171,7 +283,15 @@ def generate_two_individuals(idv_pool, rate_crossover=0.5):
     new_idv2[IDV_GENOTYPE] = []
 
     # assign gene value
-    if r.random() <= rate_crossover:
+    if r.random() > rate_crossover:
+        new_idv1[IDV_GENOTYPE] = parent_x
+        new_idv2[IDV_GENOTYPE] = parent_y
+    elif IS_RANK_ENCODING:
+        # mask == 0, px[i] -> idv1[i], py[i] -> idv2[i]; mask == 1, px[i] -> idv2[i], py[i] -> idv1[i]
+        mask = np.random.randint(0, 2, IDV_LENGTH).astype(bool)
+        new_idv1[IDV_GENOTYPE] = np.where(mask, parent_y, parent_x)
+        new_idv2[IDV_GENOTYPE] = np.where(mask, parent_x, parent_y)
+    else:
         for i in range(0, IDV_LENGTH):
             # mask == 0, px[i] -> idv1[i], py[i] -> idv2[i]
             if r.randint(0, 1) == 0:
@@ -181,16 +301,27 @@ def generate_two_individuals(idv_pool, rate_crossover=0.5):
             else:
                 new_idv1[IDV_GENOTYPE].append(parent_y[i])
                 new_idv2[IDV_GENOTYPE].append(parent_x[i])
-    else:
-        new_idv1[IDV_GENOTYPE] = parent_x
-        new_idv2[IDV_GENOTYPE] = parent_y
 
     return new_idv1, new_idv2
 
 
-def generate_population(size_population=100):
+def generate_population(size_population=100, rate_seeding=0.0, warm_genotype=None, rate_mutation=0.05):
     idv_pool = []
-    for i in range(0, size_population):
+
+    # warm start: the previous solution and its mutants
+    if warm_genotype is not None:
+        idv_pool.append({IDV_GENOTYPE: p_deepcopy(warm_genotype)})
+        warm_pool = [{IDV_GENOTYPE: p_deepcopy(warm_genotype)} for i in range(1, int(WARM_START_RATE * size_population))]
+        idv_pool += mutation(warm_pool, len(warm_pool), rate_mutation)
+
+    # seeded individuals, label propagation with different seeds
+    for i in range(0, min(int(rate_seeding * size_population), size_population - len(idv_pool))):
+        idv = dict()
+        idv[IDV_GENOTYPE] = generate_seeded_genotype(r.randint(0, 2 ** 31 - 1))
+        idv_pool.append(idv)
+
+    # random individuals, for diversity
+    for i in range(len(idv_pool), size_population):
         idv_pool.append(generate_an_individual())
 
     return idv_pool
@@ -232,6 +363,12 @@ def mutation(idv_pool, size_population=100, rate_mutation=0.05):
     for i in range(0, size_population):
         idv = idv_pool[i][IDV_GENOTYPE]
 
+        # a new rank is always a legal neighbor, no need to look up NEIGHBOR_LIST
+        if IS_RANK_ENCODING:
+            mask = np.random.random_sample(IDV_LENGTH) <= rate_mutation
+            idv[mask] = (np.random.random_sample(mask.sum()) * NEIGHBOR_DEGREE[0: IDV_LENGTH][mask]).astype(GENE_RANK_DTYPE)
+            continue
+
         for j in range(0, IDV_LENGTH):
             if r.random() <= rate_mutation:
                 node_id = GENE_TO_NODE[j]
@@ -241,29 +378,221 @@ def mutation(idv_pool, size_population=100, rate_mutation=0.05):
     return idv_pool
 
 
+def adapt_rate(fitness_best, diversity, rate_crossover=0.5, rate_mutation=0.05):
+    # improvement: keep the mutation rate while the best fitness improves, otherwise smaller changes
+    if len(fitness_best) >= 2 and fitness_best[-1] <= fitness_best[-2]:
+        rate_mutation *= ADAPTIVE_DECAY
+
+    # diversity: a converged population needs mutation more than crossover
+    if diversity < ADAPTIVE_DIVERSITY:
+        rate_mutation *= ADAPTIVE_BOOST
+        rate_crossover *= ADAPTIVE_DECAY
+    else:
+        rate_crossover /= ADAPTIVE_DECAY
+
+    rate_crossover = min(max(rate_crossover, ADAPTIVE_RATE_CROSSOVER[0]), ADAPTIVE_RATE_CROSSOVER[1])
+    rate_mutation = min(max(rate_mutation, ADAPTIVE_RATE_MUTATION[0]), ADAPTIVE_RATE_MUTATION[1])
+
+    return rate_crossover, rate_mutation
+
+
 # --------------------------------------------------
+def rank_dtype(neighbor_degree):
+    # minimal dtype of the neighbor rank
+    max_degree = neighbor_degree.max() if len(neighbor_degree) else 0
+
+    return np.uint8 if max_degree <= 2 ** 8 else np.uint16 if max_degree <= 2 ** 16 else np.uint32
+
+
 def initialization(g):
-    global IDV_LENGTH, GENE_TO_NODE, NODE_TO_GENE, NEIGHBOR_LIST
+    global NUM_NODE, IDV_LENGTH, GENE_TO_NODE, NODE_TO_GENE, NEIGHBOR_LIST, FORCED_GENE
+    global NEIGHBOR_INDPTR, NEIGHBOR_INDICES, NEIGHBOR_DEGREE, GENE_RANK_DTYPE
+
+    # create neighbor list
+    NEIGHBOR_LIST = {}
+
+    for i in g:
+        NEIGHBOR_LIST[i] = list(g.neighbors(i))
 
-    # length of individual
-    IDV_LENGTH = c.copy(g.number_of_nodes())
+    # an isolated node has no legal gene value
+    isolated_node = [i for i in g if len(NEIGHBOR_LIST[i]) == 0]
 
-    # mapping gene-to-node and node-to-gene
+    if isolated_node:
+        raise ValueError("isolated nodes have no legal gene value: {0}".format(isolated_node[0: 10]))
+
+    # forced loci: a degree-1 node has only one legal gene value
+    free_node = [i for i in g if len(NEIGHBOR_LIST[i]) != 1]
+    forced_node = [i for i in g if len(NEIGHBOR_LIST[i]) == 1]
+
+    # length of individual, only free loci are evolved
+    NUM_NODE = c.copy(g.number_of_nodes())
+    IDV_LENGTH = len(free_node)
+
+    # mapping gene-to-node and node-to-gene, free loci first
     gene_index = 0
+    GENE_TO_NODE = {}
+    NODE_TO_GENE = {}
 
-    for i in g:
+    for i in free_node + forced_node:
         GENE_TO_NODE[gene_index] = c.copy(i)
         NODE_TO_GENE[i] = c.copy(gene_index)
         gene_index += 1
 
-    # create neighbor list
-    for i in g:
+    FORCED_GENE = [(NODE_TO_GENE[i], NODE_TO_GENE[NEIGHBOR_LIST[i][0]]) for i in forced_node]
+
+    # CSR adjacency index of genes
+    gene_degree = [len(NEIGHBOR_LIST[GENE_TO_NODE[x]]) for x in range(0, NUM_NODE)]
+    NEIGHBOR_INDPTR = np.concatenate(([0], np.cumsum(gene_degree))).astype(np.int64)
+    NEIGHBOR_INDICES = np.array([NODE_TO_GENE[j] for x in range(0, NUM_NODE) for j in NEIGHBOR_LIST[GENE_TO_NODE[x]]],
+                                dtype=np.int64)
+    NEIGHBOR_DEGREE = np.array(gene_degree, dtype=np.int64)
+
+    GENE_RANK_DTYPE = rank_dtype(NEIGHBOR_DEGREE)
+
+    # node degree, or node strength of weighted (coarse) graph
+    g = ml.add_node_strength(g)
+
+    return g
+
+
+def get_graph_index():
+    # graph index built by initialization(), to reuse it without re-indexing
+    return {'GENE_TO_NODE': GENE_TO_NODE,
+            'NODE_TO_GENE': NODE_TO_GENE,
+            'NEIGHBOR_LIST': NEIGHBOR_LIST,
+            'FORCED_GENE': FORCED_GENE,
+            'NEIGHBOR_INDPTR': NEIGHBOR_INDPTR,
+            'NEIGHBOR_INDICES': NEIGHBOR_INDICES,
+            'NEIGHBOR_DEGREE': NEIGHBOR_DEGREE,
+            'GENE_RANK_DTYPE': GENE_RANK_DTYPE,
+            'NUM_NODE': NUM_NODE,
+            'IDV_LENGTH': IDV_LENGTH}
+
+
+def set_graph_index(graph_index):
+    global NUM_NODE, IDV_LENGTH, GENE_TO_NODE, NODE_TO_GENE, NEIGHBOR_LIST, FORCED_GENE
+    global NEIGHBOR_INDPTR, NEIGHBOR_INDICES, NEIGHBOR_DEGREE, GENE_RANK_DTYPE
+
+    GENE_TO_NODE = graph_index['GENE_TO_NODE']
+    NODE_TO_GENE = graph_index['NODE_TO_GENE']
+    NEIGHBOR_LIST = graph_index['NEIGHBOR_LIST']
+    FORCED_GENE = graph_index['FORCED_GENE']
+    NEIGHBOR_INDPTR = graph_index['NEIGHBOR_INDPTR']
+    NEIGHBOR_INDICES = graph_index['NEIGHBOR_INDICES']
+    NEIGHBOR_DEGREE = graph_index['NEIGHBOR_DEGREE']
+    GENE_RANK_DTYPE = graph_index['GENE_RANK_DTYPE']
+    NUM_NODE = graph_index['NUM_NODE']
+    IDV_LENGTH = graph_index['IDV_LENGTH']
+
+
+# --------------------------------------------------
+# warm start
+# --------------------------------------------------
+def update_network(g, edge_add=(), edge_remove=()):
+    # apply the edge diff, the nodes of the diff are returned as changed nodes
+    changed_node = set()
+
+    for (ei, ej) in edge_remove:
+        if g.has_edge(ei, ej):
+            g.remove_edge(ei, ej)
+
+        changed_node.update((ei, ej))
+
+    for (ei, ej) in edge_add:
+        if ei != ej:
+            g.add_edge(ei, ej)
+            changed_node.update((ei, ej))
+
+    # an isolated node has no legal gene value
+    g.remove_nodes_from([i for i in changed_node if i in g and g.degree(i) == 0])
+
+    return g, changed_node
+
+
+def update_initialization(g, changed_node):
+    """
+    Update the graph index of initialization() after update_network(), only the
+    neighbor lists and CSR rows of the changed nodes are rebuilt. The whole index
+    is rebuilt if the gene order changes, i.e., a node is added or removed, or a
+    node becomes or stops being a forced locus.
+    """
+    global NEIGHBOR_LIST, FORCED_GENE, NEIGHBOR_INDPTR, NEIGHBOR_INDICES, NEIGHBOR_DEGREE, GENE_RANK_DTYPE
+
+    for i in changed_node:
+        if i not in g or i not in NODE_TO_GENE or (NODE_TO_GENE[i] < IDV_LENGTH) != (g.degree(i) != 1):
+            return initialization(g)
+
+    # neighbor list, a new dict: the previous index may be shared, e.g., by get_graph_index()
+    NEIGHBOR_LIST = dict(NEIGHBOR_LIST)
+
+    for i in changed_node:
         NEIGHBOR_LIST[i] = list(g.neighbors(i))
-        g.node[i][NODE_DEGREE] = len(NEIGHBOR_LIST[i])
+
+    # CSR rows of the changed genes, the other rows are copied in blocks
+    neighbor_degree = NEIGHBOR_DEGREE.copy()
+    indices_block = []
+    x_start = 0
+
+    for x in sorted(NODE_TO_GENE[i] for i in changed_node):
+        indices_block.append(NEIGHBOR_INDICES[NEIGHBOR_INDPTR[x_start]: NEIGHBOR_INDPTR[x]])
+        indices_block.append(np.array([NODE_TO_GENE[j] for j in NEIGHBOR_LIST[GENE_TO_NODE[x]]], dtype=np.int64))
+        neighbor_degree[x] = len(NEIGHBOR_LIST[GENE_TO_NODE[x]])
+        x_start = x + 1
+
+    indices_block.append(NEIGHBOR_INDICES[NEIGHBOR_INDPTR[x_start]:])
+    NEIGHBOR_INDPTR = np.concatenate(([0], np.cumsum(neighbor_degree))).astype(np.int64)
+    NEIGHBOR_INDICES = np.concatenate(indices_block)
+    NEIGHBOR_DEGREE = neighbor_degree
+
+    GENE_RANK_DTYPE = rank_dtype(NEIGHBOR_DEGREE)
+
+    # forced loci, genes IDV_LENGTH..NUM_NODE-1: a degree-1 node may have a new neighbor
+    if any(NODE_TO_GENE[i] >= IDV_LENGTH for i in changed_node):
+        FORCED_GENE = [(x, NODE_TO_GENE[NEIGHBOR_LIST[GENE_TO_NODE[x]][0]]) for x in range(IDV_LENGTH, NUM_NODE)]
+
+    # node degree of the changed nodes
+    for i in changed_node:
+        g.node[i][NODE_DEGREE] = g.degree(i, weight=EDGE_WEIGHT) + 2 * g.node[i].get(NODE_SELF_WEIGHT, 0)
 
     return g
 
 
+def genotype_to_locus(genotype):
+    # genotype -> {node_id: neighbor node_id}, it does not depend on the gene order of the index
+    gene_list = decode_genotype(genotype)
+
+    return {GENE_TO_NODE[x]: GENE_TO_NODE[y] for (x, y) in enumerate(gene_list)}
+
+
+def warm_start_genotype(g, community_list, locus=None):
+    """
+    Genotype of the previous solution on the updated graph. A gene of the
+    previous locus is kept if its edge still exists, otherwise it is repaired to
+    a neighbor of the same previous community; without the locus, the genotype
+    is built from the previous partition. A new node starts as its own community.
+    """
+    membership = ml.community_to_membership(community_list)
+    labels = [membership.get(GENE_TO_NODE[x], len(community_list) + x) for x in range(0, NUM_NODE)]
+
+    if locus is None:
+        return partition_to_genotype(labels)
+
+    gene_list = []
+
+    for x in range(0, IDV_LENGTH):
+        i = GENE_TO_NODE[x]
+        j = locus.get(i)
+
+        if j is not None and g.has_edge(i, j):
+            gene_list.append(NODE_TO_GENE[j])
+        else:
+            neighbor_gene = [NODE_TO_GENE[j] for j in NEIGHBOR_LIST[i]]
+            same_gene = [y for y in neighbor_gene if labels[y] == labels[x]]
+            gene_list.append(r.choice(same_gene if same_gene else neighbor_gene))
+
+    return encode_genotype(gene_list)
+
+
 def evaluation(g, idv_pool, size_population=100):
     for i in range(0, size_population):
         idv = idv_pool[i]
@@ -275,25 +604,71 @@ def evaluation(g, idv_pool, size_population=100):
     return idv_pool
 
 
+def evaluate_distance_best(idv_pool):
+    # mean NMI distance of the evaluated individuals to the best one, time complexity: O(P * N)
+    if len(idv_pool) < 2:
+        return 0.0
+
+    label_matrix = [psm.community_to_label(idv[IDV_PHENOTYPE], NODE_TO_GENE) for idv in idv_pool]
+
+    return float(np.mean(1 - psm.nmi_from_statistic(psm.contingency_statistic(label_matrix[0], label_matrix[1:]))))
+
+
+def evaluate_diversity(idv_pool):
+    # mean pairwise NMI distance of the evaluated individuals
+    return psm.population_diversity([psm.community_to_label(idv[IDV_PHENOTYPE], NODE_TO_GENE) for idv in idv_pool])
+
+
+def evaluate_accuracy(g, idv):
+    # NMI and ARI against the ground-truth communities, if the nodes have NODE_COMMUNITY
+    if all(NODE_COMMUNITY in g.node[i] for i in g):
+        node_index = {i: k for (k, i) in enumerate(g)}
+        truth_index = {}
+        truth_label = [truth_index.setdefault(g.node[i][NODE_COMMUNITY], len(truth_index)) for i in g]
+        idv_label = psm.community_to_label(idv[IDV_PHENOTYPE], node_index)
+
+        idv[IDV_NMI] = psm.normalized_mutual_information(truth_label, idv_label)
+        idv[IDV_ARI] = psm.adjusted_rand_index(truth_label, idv_label)
+
+    return idv
+
+
 def locus_based_genetic_algorithm(g,
                                   num_evolution=1,
                                   num_generation=100,
                                   size_population=100,
                                   rate_selection=0.1,
                                   rate_crossover=0.5,
-                                  rate_mutation=0.05):
-    # initialization
+                                  rate_mutation=0.05,
+                                  rate_seeding=0.0,
+                                  graph_index=None,
+                                  callback=None,
+                                  gene_encoding='gene',
+                                  min_diversity=None,
+                                  is_adaptive_rate=False,
+                                  warm_genotype=None):
+    global IS_RANK_ENCODING
+
+    # initialization, or reuse the graph index of g
     evo_best = []
-    g = initialization(g)
+    IS_RANK_ENCODING = (gene_encoding == 'rank')
+
+    if graph_index is None:
+        g = initialization(g)
+    else:
+        set_graph_index(graph_index)
 
     # evolution
     for i in range(0, num_evolution):
         print(" --- Evolution {0}".format(i + 1))
         fitness_avg = []
         fitness_best = []
+        evo_record = {EVO_DIVERSITY: [], EVO_DISTANCE_BEST: [], EVO_RATE_CROSSOVER: [], EVO_RATE_MUTATION: []}
+        rate_crossover_j = rate_crossover
+        rate_mutation_j = rate_mutation
 
         # create individual pool
-        idv_pool = generate_population(size_population)
+        idv_pool = generate_population(size_population, rate_seeding, warm_genotype, rate_mutation)
 
         # generation
         idv_best = dict()
@@ -322,28 +697,169 @@ def locus_based_genetic_algorithm(g,
             fitness_avg.append(np.mean([idv[IDV_FITNESS] for idv in idv_pool]))
             fitness_best.append(idv_best[IDV_FITNESS])
 
+            # record diversity, if diversity-based stop condition is used
+            if min_diversity is not None:
+                evo_record[EVO_DIVERSITY].append(evaluate_diversity(idv_pool))
+
+            # record distance to the best individual, if adaptive rate is used
+            if is_adaptive_rate:
+                evo_record[EVO_DISTANCE_BEST].append(evaluate_distance_best(idv_pool))
+
+            # report progress: callback(evolution, generation, fitness_avg, fitness_best)
+            if callback is not None:
+                callback(i, j, fitness_avg[-1], fitness_best[-1])
+
             # stop condition
             if (j + 1) == num_generation:
                 break
+            elif min_diversity is not None and evo_record[EVO_DIVERSITY][-1] < min_diversity:
+                break
             else:
                 pass
 
+            # adaptive rate: best fitness and distance to the best individual
+            if is_adaptive_rate:
+                rate_crossover_j, rate_mutation_j = adapt_rate(fitness_best,
+                                                               evo_record[EVO_DISTANCE_BEST][-1],
+                                                               rate_crossover_j,
+                                                               rate_mutation_j)
+
+            evo_record[EVO_RATE_CROSSOVER].append(rate_crossover_j)
+            evo_record[EVO_RATE_MUTATION].append(rate_mutation_j)
+
             # genetic operation: selection, crossover and mutation
             idv_pool = selection(idv_pool, size_population, rate_selection)
-            idv_pool = crossover(idv_pool, size_population, rate_crossover)
-            idv_pool = mutation(idv_pool, size_population, rate_mutation)
+            idv_pool = crossover(idv_pool, size_population, rate_crossover_j)
+            idv_pool = mutation(idv_pool, size_population, rate_mutation_j)
 
         # maintain evo_best
+        idv_best = evaluate_accuracy(g, idv_best)
+
         if not evo_best:
-            evo_best = [idv_best, fitness_avg, fitness_best]
+            evo_best = [idv_best, fitness_avg, fitness_best, evo_record]
         elif idv_best[IDV_FITNESS] > evo_best[0][IDV_FITNESS]:
-            evo_best = [idv_best, fitness_avg, fitness_best]
+            evo_best = [idv_best, fitness_avg, fitness_best, evo_record]
         else:
             pass
 
     return evo_best
 
 
+def multilevel_locus_based_genetic_algorithm(g,
+                                             size_coarsest=100,
+                                             num_refinement=3,
+                                             num_evolution=1,
+                                             num_generation=100,
+                                             size_population=100,
+                                             rate_selection=0.1,
+                                             rate_crossover=0.5,
+                                             rate_mutation=0.05,
+                                             rate_seeding=0.0,
+                                             gene_encoding='gene',
+                                             min_diversity=None,
+                                             is_adaptive_rate=False):
+    # coarsening: heavy-edge matching until the graph has size_coarsest nodes
+    g = ml.add_node_strength(g)
+    level_list = ml.coarsen_graph(g, size_coarsest)
+    graph_list = [g] + [g_coarse for (g_coarse, node_map) in level_list]
+    print(" --- Coarsening {0} levels, {1} -> {2} nodes".format(len(level_list),
+                                                              g.number_of_nodes(),
+                                                              graph_list[-1].number_of_nodes()))
+
+    # isolated coarse nodes, i.e., contracted small components, are fixed singletons
+    g_evolution = graph_list[-1].copy()
+    isolated_node = [i for i in g_evolution if g_evolution.degree(i) == 0]
+    g_evolution.remove_nodes_from(isolated_node)
+
+    # evolution on the coarsest graph
+    idv_best, fitness_avg, fitness_best, evo_record = locus_based_genetic_algorithm(g_evolution,
+                                                                                    num_evolution,
+                                                                                    num_generation,
+                                                                                    size_population,
+                                                                                    rate_selection,
+                                                                                    rate_crossover,
+                                                                                    rate_mutation,
+                                                                                    rate_seeding,
+                                                                                    gene_encoding=gene_encoding,
+                                                                                    min_diversity=min_diversity,
+                                                                                    is_adaptive_rate=is_adaptive_rate)
+
+    # uncoarsening: project the best partition back level by level, then refine it
+    membership = ml.community_to_membership(idv_best[IDV_PHENOTYPE] + [[i] for i in isolated_node])
+
+    for k in range(len(level_list) - 1, -1, -1):
+        membership = ml.project_membership(membership, level_list[k][1])
+        membership = ml.refine_membership(graph_list[k], membership, num_refinement)
+
+    # the best individual of the original graph, its genotype is not kept
+    idv_best = dict()
+    idv_best[IDV_PHENOTYPE] = ml.membership_to_community(membership)
+    idv_best[IDV_FITNESS] = modularity(g, idv_best[IDV_PHENOTYPE])
+    idv_best = evaluate_accuracy(g, idv_best)
+
+    return [idv_best, fitness_avg, fitness_best, evo_record]
+
+
+def incremental_locus_based_genetic_algorithm(g,
+                                              idv_previous,
+                                              edge_add=(),
+                                              edge_remove=(),
+                                              graph_index=None,
+                                              num_evolution=1,
+                                              num_generation=100,
+                                              size_population=100,
+                                              rate_selection=0.1,
+                                              rate_crossover=0.5,
+                                              rate_mutation=0.05,
+                                              rate_seeding=0.0,
+                                              callback=None,
+                                              gene_encoding='gene',
+                                              min_diversity=None,
+                                              is_adaptive_rate=False):
+    """
+    Warm-start LGA of a changed network: g is the previous network and
+    graph_index its index (the genotype of idv_previous is read with it), the
+    edge diff is applied to g and the index is updated. If idv_previous has no
+    genotype, e.g., g is already the current network, only its partition is used.
+    After the evolution, get_graph_index() returns the index of the updated g.
+    """
+    global IS_RANK_ENCODING
+
+    # previous index, to read the previous genotype
+    IS_RANK_ENCODING = (gene_encoding == 'rank')
+
+    if graph_index is None:
+        g = initialization(g)
+    else:
+        set_graph_index(graph_index)
+
+    if IDV_GENOTYPE in idv_previous:
+        locus = genotype_to_locus(idv_previous[IDV_GENOTYPE])
+    else:
+        locus = None
+
+    # update the network and its index, then repair the previous solution
+    g, changed_node = update_network(g, edge_add, edge_remove)
+    g = update_initialization(g, changed_node)
+    warm_genotype = warm_start_genotype(g, idv_previous[IDV_PHENOTYPE], locus)
+    print(" --- Warm start, {0} changed nodes".format(len(changed_node)))
+
+    return locus_based_genetic_algorithm(g,
+                                         num_evolution,
+                                         num_generation,
+                                         size_population,
+                                         rate_selection,
+                                         rate_crossover,
+                                         rate_mutation,
+                                         rate_seeding,
+                                         graph_index=get_graph_index(),
+                                         callback=callback,
+                                         gene_encoding=gene_encoding,
+                                         min_diversity=min_diversity,
+                                         is_adaptive_rate=is_adaptive_rate,
+                                         warm_genotype=warm_genotype)
+
+
 # --------------------------------------------------------------------------------
 # 4.Main function
 # --------------------------------------------------------------------------------
@@ -364,6 +880,18 @@ def main_function():
     rate_selection = 0.1
     rate_crossover = 0.8
     rate_mutation = 0.05
+    rate_seeding = 0.0  # rate of the initial population seeded by label propagation
+    gene_encoding = 'gene'  # 'gene': gene id, 'rank': compact rank of the neighbor
+    min_diversity = None  # stop when the population diversity (1 - NMI) is lower
+    is_adaptive_rate = False  # adapt rate_crossover and rate_mutation in each generation
+
+    # incremental variable, warm start from the previous result of the network
+    is_incremental = False
+
+    # multilevel variables, for large networks
+    is_multilevel = False
+    size_coarsest = 100
+    num_refinement = 3
 
     # --------------------------------------------------
     # read edge-list file of networks
@@ -386,13 +914,52 @@ def main_function():
         ph.write_pickle_file(g, file_path)
 
         print(" -- LGA evolution")
-        evo_result = locus_based_genetic_algorithm(g,
-                                                   num_evolution,
-                                                   num_generation,
-                                                   size_population,
-                                                   rate_selection,
-                                                   rate_crossover,
-                                                   rate_mutation)
+        file_path = "{0}{1}-lga.pickle".format(FOLDER_FILE, net_name)
+
+        if is_incremental and os.path.isfile(file_path):
+            # the index of g is rebuilt, so only the previous partition is used
+            idv_previous = {IDV_PHENOTYPE: ph.read_pickle_file(file_path)[0][IDV_PHENOTYPE]}
+            evo_result = incremental_locus_based_genetic_algorithm(g,
+                                                                   idv_previous,
+                                                                   num_evolution=num_evolution,
+                                                                   num_generation=num_generation,
+                                                                   size_population=size_population,
+                                                                   rate_selection=rate_selection,
+                                                                   rate_crossover=rate_crossover,
+                                                                   rate_mutation=rate_mutation,
+                                                                   rate_seeding=rate_seeding,
+                                                                   gene_encoding=gene_encoding,
+                                                                   min_diversity=min_diversity,
+                                                                   is_adaptive_rate=is_adaptive_rate)
+        elif is_multilevel:
+            evo_result = multilevel_locus_based_genetic_algorithm(g,
+                                                                  size_coarsest,
+                                                                  num_refinement,
+                                                                  num_evolution,
+                                                                  num_generation,
+                                                                  size_population,
+                                                                  rate_selection,
+                                                                  rate_crossover,
+                                                                  rate_mutation,
+                                                                  rate_seeding,
+                                                                  gene_encoding,
+                                                                  min_diversity,
+                                                                  is_adaptive_rate)
+        else:
+            evo_result = locus_based_genetic_algorithm(g,
+                                                       num_evolution,
+                                                       num_generation,
+                                                       size_population,
+                                                       rate_selection,
+                                                       rate_crossover,
+                                                       rate_mutation,
+                                                       rate_seeding,
+                                                       gene_encoding=gene_encoding,
+                                                       min_diversity=min_diversity,
+                                                       is_adaptive_rate=is_adaptive_rate)
+
+        if IDV_NMI in evo_result[0]:
+            print(" -- Accuracy: NMI {0:.4f}, ARI {1:.4f}".format(evo_result[0][IDV_NMI], evo_result[0][IDV_ARI]))
 
         print(" -- Save evolution result")
         file_path = "{0}{1}-lga.pickle".format(FOLDER_FILE, net_name)
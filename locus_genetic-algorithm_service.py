@@ -0,0 +1,379 @@
+"""
+Locus-based Genetic Algorithm (LGA) service
+
+A long-running local service of LGA: a client sends a job as a JSON line, i.e.,
+an edge list or the id of a cached graph plus GA parameters, and receives JSON
+lines of the queue status, the per-generation progress and the best partition.
+
+    {"graph_id": "karate_gcc", "num_generation": 50}
+    {"graph_id": "g1", "edge_list": ["1 2", "2 3", "3 1"], "rate_mutation": 0.1}
+
+@auth: Yu-Hsiang Fu
+@date: 2026/10/19
+"""
+# --------------------------------------------------------------------------------
+# 1.Import modular
+# --------------------------------------------------------------------------------
+# import modular
+import asyncio
+import collections
+import concurrent.futures
+import concurrent.futures.process
+import functools
+import importlib
+import json
+import multiprocessing as mp
+import os
+import os.path
+import tempfile
+import time
+
+# import custom-modular
+import util.handler.edgelist_handler as eh
+
+# import folder-constant
+from util.constant.constant_folder import FOLDER_EDGELIST
+
+# import LGA modular
+lga = importlib.import_module("locus_genetic-algorithm")
+
+
+# --------------------------------------------------------------------------------
+# 2.Define variable
+# --------------------------------------------------------------------------------
+# service variable
+SERVICE_HOST = '127.0.0.1'
+SERVICE_PORT = 8765
+SERVICE_SOCKET = None  # path of unix socket, it replaces host and port
+NUM_WORKER = 2
+SIZE_CACHE = 8
+SIZE_GRAPH = 64  # registered graphs of the server, LRU
+
+# GA variable, default parameters of a job
+GA_PARAMETER = {'num_evolution': 1,
+                'num_generation': 50,
+                'size_population': 100,
+                'rate_selection': 0.1,
+                'rate_crossover': 0.8,
+                'rate_mutation': 0.05,
+                'rate_seeding': 0.0,
+                'gene_encoding': 'gene',
+                'is_adaptive_rate': False}
+GA_PARAMETER_RANGE = {'num_evolution': (1, 100),  # (min, max) of a number
+                      'num_generation': (1, 10000),
+                      'size_population': (2, 10000),
+                      'rate_selection': (0.0, 1.0),
+                      'rate_crossover': (0.0, 1.0),
+                      'rate_mutation': (0.0, 1.0),
+                      'rate_seeding': (0.0, 1.0)}
+GA_PARAMETER_CHOICE = {'gene_encoding': ('gene', 'rank')}
+
+# server variable
+GRAPH_FILE = collections.OrderedDict()  # graph_id -> edge-list file, LRU
+GRAPH_JOB = collections.Counter()  # edge-list file -> number of queued and running jobs
+GRAPH_COUNTER = iter(range(1, 2 ** 63))
+JOB_STREAM = {}  # job_id -> message queue of the client
+WORKER_POOL = None
+
+# worker variable
+GRAPH_CACHE = collections.OrderedDict()  # edge-list file -> (g, graph_index), LRU
+PROGRESS_QUEUE = None
+
+
+# --------------------------------------------------------------------------------
+# 3.Define function
+# --------------------------------------------------------------------------------
+# --------------------------------------------------
+# worker function
+# --------------------------------------------------
+def init_worker(progress_queue):
+    global PROGRESS_QUEUE
+    PROGRESS_QUEUE = progress_queue
+
+
+def load_graph(file_path):
+    # warm graph: reuse the indexed graph in LRU cache
+    if file_path in GRAPH_CACHE:
+        GRAPH_CACHE.move_to_end(file_path)
+    else:
+        g = lga.create_network(eh.read_edgelist(file_path))
+        g = lga.initialization(g)
+        GRAPH_CACHE[file_path] = (g, lga.get_graph_index())
+
+        if len(GRAPH_CACHE) > SIZE_CACHE:
+            GRAPH_CACHE.popitem(last=False)
+
+    return GRAPH_CACHE[file_path]
+
+
+def run_job(job_id, file_path, ga_parameter):
+    def report_progress(i, j, fitness_avg, fitness_best):
+        PROGRESS_QUEUE.put((job_id, {'status': 'progress',
+                                     'job_id': job_id,
+                                     'evolution': i + 1,
+                                     'generation': j + 1,
+                                     'fitness_avg': fitness_avg,
+                                     'fitness_best': fitness_best}))
+
+    # the result is sent after the progress, through the same queue
+    try:
+        time_start = time.time()
+        g, graph_index = load_graph(file_path)
+        PROGRESS_QUEUE.put((job_id, {'status': 'running', 'job_id': job_id}))
+
+        idv_best = lga.locus_based_genetic_algorithm(g,
+                                                     graph_index=graph_index,
+                                                     callback=report_progress,
+                                                     **ga_parameter)[0]
+        PROGRESS_QUEUE.put((job_id, {'status': 'done',
+                                     'job_id': job_id,
+                                     'fitness': idv_best[lga.IDV_FITNESS],
+                                     'community': idv_best[lga.IDV_PHENOTYPE],
+                                     'runtime': time.time() - time_start}))
+    except Exception as e:
+        PROGRESS_QUEUE.put((job_id, {'status': 'error', 'job_id': job_id, 'message': repr(e)}))
+
+
+# --------------------------------------------------
+# server function
+# --------------------------------------------------
+def release_graph_file(file_path, folder_graph):
+    # delete an uploaded edge-list file, once it is neither registered nor used by a job
+    if os.path.dirname(file_path) == folder_graph and GRAPH_JOB[file_path] == 0 \
+            and file_path not in GRAPH_FILE.values() and os.path.isfile(file_path):
+        os.remove(file_path)
+
+    if GRAPH_JOB[file_path] == 0:
+        del GRAPH_JOB[file_path]
+
+
+def register_graph(request, folder_graph):
+    graph_id = str(request.get('graph_id', ''))
+    file_previous = GRAPH_FILE.get(graph_id)
+
+    if 'edge_list' in request:
+        # new graph, or a new version of the graph; a new file name, the workers cache graphs by file
+        graph_id = graph_id if graph_id else "graph-{0}".format(next(GRAPH_COUNTER))
+        file_path = os.path.join(folder_graph, "{0}.txt".format(next(GRAPH_COUNTER)))
+
+        with open(file_path, mode="w") as f:
+            for edge in request['edge_list']:
+                f.write("{0}\n".format(edge if isinstance(edge, str) else " ".join(str(i) for i in edge)))
+
+        GRAPH_FILE[graph_id] = file_path
+    elif graph_id in GRAPH_FILE:
+        pass
+    elif graph_id and os.path.basename(graph_id) == graph_id \
+            and os.path.isfile("{0}{1}.txt".format(FOLDER_EDGELIST, graph_id)):
+        GRAPH_FILE[graph_id] = "{0}{1}.txt".format(FOLDER_EDGELIST, graph_id)
+    else:
+        raise ValueError("unknown graph_id: {0}".format(graph_id))
+
+    # LRU of registered graphs, the replaced and evicted files are released
+    GRAPH_FILE.move_to_end(graph_id)
+
+    if file_previous is not None:
+        release_graph_file(file_previous, folder_graph)
+
+    while len(GRAPH_FILE) > SIZE_GRAPH:
+        release_graph_file(GRAPH_FILE.popitem(last=False)[1], folder_graph)
+
+    return graph_id, GRAPH_FILE[graph_id]
+
+
+def parse_ga_parameter(request):
+    # validate by the type of the default value, a bool is not a number and nothing is converted
+    ga_parameter = {}
+
+    for (key, default) in GA_PARAMETER.items():
+        value = request.get(key, default)
+
+        if isinstance(default, bool):
+            is_valid = isinstance(value, bool)
+        elif isinstance(default, int):
+            is_valid = isinstance(value, int) and not isinstance(value, bool)
+        elif isinstance(default, float):
+            is_valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+            value = float(value) if is_valid else value
+        else:
+            is_valid = isinstance(value, str)
+
+        if not is_valid:
+            raise ValueError("{0} must be {1}: {2!r}".format(key, type(default).__name__, value))
+        elif key in GA_PARAMETER_RANGE:
+            value_min, value_max = GA_PARAMETER_RANGE[key]
+
+            if value < value_min or (value_max is not None and value > value_max):
+                raise ValueError("{0} must be in [{1}, {2}]: {3!r}".format(key, value_min, value_max, value))
+        elif key in GA_PARAMETER_CHOICE and value not in GA_PARAMETER_CHOICE[key]:
+            raise ValueError("{0} must be one of {1}: {2!r}".format(key, GA_PARAMETER_CHOICE[key], value))
+        else:
+            pass
+
+        ga_parameter[key] = value
+
+    # selection must keep at least one parent
+    if int(ga_parameter['rate_selection'] * ga_parameter['size_population']) < 1:
+        raise ValueError("rate_selection * size_population must be at least 1: {0!r} * {1!r}".format(
+            ga_parameter['rate_selection'], ga_parameter['size_population']))
+
+    return ga_parameter
+
+
+def relay_progress(loop, progress_queue):
+    # one thread moves the messages of workers to the message queues of clients
+    while True:
+        item = progress_queue.get()
+
+        if item is None:
+            break
+
+        job_id, message = item
+        job_stream = JOB_STREAM.get(job_id)
+
+        if job_stream is not None:
+            loop.call_soon_threadsafe(job_stream.put_nowait, message)
+
+
+def create_pool(num_worker, mp_context, progress_queue):
+    return concurrent.futures.ProcessPoolExecutor(num_worker,
+                                                  mp_context=mp_context,
+                                                  initializer=init_worker,
+                                                  initargs=(progress_queue,))
+
+
+async def dispatch_job(job_queue, pool_factory):
+    global WORKER_POOL
+    loop = asyncio.get_running_loop()
+
+    while True:
+        job_id, file_path, ga_parameter = await job_queue.get()
+        pool = WORKER_POOL
+
+        try:
+            await loop.run_in_executor(pool, run_job, job_id, file_path, ga_parameter)
+        except concurrent.futures.process.BrokenProcessPool as e:
+            # a worker died, e.g., out of memory: the next jobs run in a new pool
+            if WORKER_POOL is pool:
+                WORKER_POOL = pool_factory()
+                pool.shutdown(wait=False)
+
+            if job_id in JOB_STREAM:
+                JOB_STREAM[job_id].put_nowait({'status': 'error', 'job_id': job_id, 'message': repr(e)})
+        except Exception as e:
+            if job_id in JOB_STREAM:
+                JOB_STREAM[job_id].put_nowait({'status': 'error', 'job_id': job_id, 'message': repr(e)})
+        finally:
+            job_queue.task_done()
+
+
+async def write_message(writer, message):
+    writer.write((json.dumps(message) + "\n").encode())
+    await writer.drain()
+
+
+async def handle_client(reader, writer, job_queue, folder_graph, job_counter):
+    try:
+        while True:
+            line = await reader.readline()
+
+            if not line:
+                break
+
+            # parse request
+            try:
+                request = json.loads(line)
+
+                if not isinstance(request, dict):
+                    raise ValueError("a request must be a JSON object: {0!r}".format(request))
+
+                graph_id, file_path = register_graph(request, folder_graph)
+                ga_parameter = parse_ga_parameter(request)
+            except (ValueError, TypeError, KeyError) as e:
+                await write_message(writer, {'status': 'error', 'message': repr(e)})
+                continue
+
+            # queue job
+            job_id = next(job_counter)
+            JOB_STREAM[job_id] = asyncio.Queue()
+            GRAPH_JOB[file_path] += 1
+
+            try:
+                await job_queue.put((job_id, file_path, ga_parameter))
+                await write_message(writer, {'status': 'queued',
+                                             'job_id': job_id,
+                                             'graph_id': graph_id,
+                                             'position': job_queue.qsize()})
+
+                # stream progress until the job is done
+                while True:
+                    message = await JOB_STREAM[job_id].get()
+                    await write_message(writer, message)
+
+                    if message['status'] in ('done', 'error'):
+                        break
+            finally:
+                del JOB_STREAM[job_id]
+                GRAPH_JOB[file_path] -= 1
+                release_graph_file(file_path, folder_graph)
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(num_worker=NUM_WORKER, host=SERVICE_HOST, port=SERVICE_PORT, socket_path=SERVICE_SOCKET):
+    global WORKER_POOL
+
+    # spawn workers, forked workers would inherit the sockets of clients
+    loop = asyncio.get_running_loop()
+    mp_context = mp.get_context('spawn')
+    progress_queue = mp_context.Queue()
+    job_queue = asyncio.Queue()
+    pool_factory = functools.partial(create_pool, num_worker, mp_context, progress_queue)
+
+    with tempfile.TemporaryDirectory() as folder_graph:
+        WORKER_POOL = pool_factory()
+        relay = loop.run_in_executor(None, relay_progress, loop, progress_queue)
+        dispatcher_list = [asyncio.ensure_future(dispatch_job(job_queue, pool_factory)) for i in range(0, num_worker)]
+        client_handler = functools.partial(handle_client,
+                                           job_queue=job_queue,
+                                           folder_graph=folder_graph,
+                                           job_counter=iter(range(1, 2 ** 63)))
+
+        if socket_path:
+            server = await asyncio.start_unix_server(client_handler, path=socket_path)
+        else:
+            server = await asyncio.start_server(client_handler, host=host, port=port)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for dispatcher in dispatcher_list:
+                dispatcher.cancel()
+
+            progress_queue.put(None)
+            await relay
+            WORKER_POOL.shutdown()
+
+
+# --------------------------------------------------------------------------------
+# 4.Main function
+# --------------------------------------------------------------------------------
+def main_function():
+    print(" Locus-based genetic algorithm (LGA) service")
+
+    if SERVICE_SOCKET:
+        print(" - Listen on {0}".format(SERVICE_SOCKET))
+    else:
+        print(" - Listen on {0}:{1}".format(SERVICE_HOST, SERVICE_PORT))
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print(" - Stop")
+
+
+if __name__ == "__main__":
+    main_function()
@@ -0,0 +1,270 @@
+"""
+Locus-based Genetic Algorithm (LGA) parameter sweep
+
+Run a grid or random search of GA parameters on one network: the graph index
+is built once and shared by the workers, each configuration is repeated with
+the same seeds, and a table of fitness (Q), runtime and generations-to-target
+per configuration is written, sorted by the hit rate of the target and runtime.
+
+@auth: Yu-Hsiang Fu
+@date: 2026/10/19
+"""
+# --------------------------------------------------------------------------------
+# 1.Import modular
+# --------------------------------------------------------------------------------
+# import modular
+import concurrent.futures
+import importlib
+import itertools
+import numpy as np
+import random as r
+import time
+
+# import custom-modular
+import util.handler.edgelist_handler as eh
+import util.handler.pickle_handler as ph
+
+# import folder-constant
+from util.constant.constant_folder import FOLDER_EDGELIST
+from util.constant.constant_folder import FOLDER_FILE
+
+# import LGA modular
+lga = importlib.import_module("locus_genetic-algorithm")
+
+
+# --------------------------------------------------------------------------------
+# 2.Define variable
+# --------------------------------------------------------------------------------
+# sweep variable
+NUM_WORKER = 4
+SWEEP_SEED = 0  # the k-th repeat of every configuration uses seed SWEEP_SEED + k
+
+# worker variable
+SWEEP_GRAPH = None
+SWEEP_GRAPH_INDEX = None
+
+
+# --------------------------------------------------------------------------------
+# 3.Define function
+# --------------------------------------------------------------------------------
+# --------------------------------------------------
+# search space
+# --------------------------------------------------
+def generate_grid_config(search_space):
+    # search_space: {parameter: [value, ...]}, all combinations
+    key_list = list(search_space.keys())
+
+    for value in search_space.values():
+        if not isinstance(value, list):
+            raise ValueError("a grid search needs a list of values: {0}".format(value))
+
+    return [dict(zip(key_list, value_list)) for value_list in itertools.product(*search_space.values())]
+
+
+def generate_random_config(search_space, num_sample=20, random_state=None):
+    # search_space: {parameter: [value, ...] or (min, max)}, a range of int values samples int
+    rs = r.Random(random_state)
+    config_list = []
+
+    for i in range(0, num_sample):
+        config = {}
+
+        for (key, value) in search_space.items():
+            if isinstance(value, list):
+                config[key] = rs.choice(value)
+            elif all(isinstance(v, int) for v in value):
+                config[key] = rs.randint(value[0], value[1])
+            else:
+                config[key] = rs.uniform(value[0], value[1])
+
+        config_list.append(config)
+
+    return config_list
+
+
+def validate_config(config):
+    # error message of a configuration that can not run, selection must keep at least one parent
+    if int(config.get('rate_selection', 0.1) * config.get('size_population', 100)) < 1:
+        return "rate_selection * size_population must be at least 1"
+    else:
+        return None
+
+
+# --------------------------------------------------
+# worker function
+# --------------------------------------------------
+def init_worker(g, graph_index):
+    global SWEEP_GRAPH, SWEEP_GRAPH_INDEX
+    SWEEP_GRAPH = g
+    SWEEP_GRAPH_INDEX = graph_index
+
+
+def run_config(config_id, config, seed):
+    r.seed(seed)
+    np.random.seed(seed)
+
+    time_start = time.time()
+    evo_result = lga.locus_based_genetic_algorithm(SWEEP_GRAPH,
+                                                   num_evolution=1,
+                                                   graph_index=SWEEP_GRAPH_INDEX,
+                                                   **config)
+
+    return {'config_id': config_id,
+            'seed': seed,
+            'fitness': evo_result[0][lga.IDV_FITNESS],
+            'fitness_best': evo_result[2],
+            'runtime': time.time() - time_start,
+            'error': None}
+
+
+def failed_result(config_id, seed, message):
+    return {'config_id': config_id,
+            'seed': seed,
+            'fitness': float('nan'),
+            'fitness_best': [],
+            'runtime': float('nan'),
+            'error': message}
+
+
+# --------------------------------------------------
+# sweep function
+# --------------------------------------------------
+def parameter_sweep(g, config_list, num_repeat=3, num_worker=NUM_WORKER):
+    # build the graph index once, the workers reuse it
+    g = lga.initialization(g)
+    graph_index = lga.get_graph_index()
+    result_list = []
+
+    # invalid configurations are recorded as failed runs, without running them
+    future_run = {}
+
+    with concurrent.futures.ProcessPoolExecutor(num_worker,
+                                                initializer=init_worker,
+                                                initargs=(g, graph_index)) as pool:
+        for (config_id, config) in enumerate(config_list):
+            message = validate_config(config)
+
+            for k in range(0, num_repeat):
+                if message is None:
+                    future = pool.submit(run_config, config_id, config, SWEEP_SEED + k)
+                    future_run[future] = (config_id, SWEEP_SEED + k)
+                else:
+                    result_list.append(failed_result(config_id, SWEEP_SEED + k, message))
+
+        # a failed run does not stop the sweep
+        for future in concurrent.futures.as_completed(future_run):
+            try:
+                result_list.append(future.result())
+            except Exception as e:
+                result_list.append(failed_result(*future_run[future], repr(e)))
+
+    return sorted(result_list, key=lambda x: (x['config_id'], x['seed']))
+
+
+def summarize_result(config_list, result_list, fitness_target=None):
+    # target: fitness_target, or 99% of the best fitness of the sweep
+    done_list = [result for result in result_list if result['error'] is None]
+
+    if fitness_target is None:
+        fitness_target = 0.99 * max(result['fitness'] for result in done_list) if done_list else float('nan')
+
+    summary_list = []
+
+    for (config_id, config) in enumerate(config_list):
+        config_result = [result for result in result_list if result['config_id'] == config_id]
+        fitness = [result['fitness'] for result in config_result if result['error'] is None]
+        runtime = [result['runtime'] for result in config_result if result['error'] is None]
+
+        # generations-to-target of the runs reaching the target
+        generation = []
+
+        for result in config_result:
+            for (j, fitness_best) in enumerate(result['fitness_best']):
+                if fitness_best >= fitness_target:
+                    generation.append(j + 1)
+                    break
+
+        summary_list.append({'config': config,
+                             'fitness_avg': np.mean(fitness) if fitness else float('nan'),
+                             'fitness_std': np.std(fitness) if fitness else float('nan'),
+                             'runtime_avg': np.mean(runtime) if runtime else float('nan'),
+                             'generation_avg': np.mean(generation) if generation else float('nan'),
+                             'rate_hit': len(generation) / len(config_result),
+                             'num_error': len(config_result) - len(fitness)})
+
+    # cheapest configuration meeting the target first, failed configurations last
+    summary_list = sorted(summary_list, key=lambda x: (-x['rate_hit'],
+                                                       x['num_error'],
+                                                       np.nan_to_num(x['runtime_avg'], nan=float('inf'))))
+
+    return summary_list, fitness_target
+
+
+def write_summary(summary_list, file_path):
+    key_list = list(dict.fromkeys(key for summary in summary_list for key in summary['config']))
+    column_list = ['fitness_avg', 'fitness_std', 'runtime_avg', 'generation_avg', 'rate_hit', 'num_error']
+    line_list = ["\t".join(key_list + column_list)]
+
+    for summary in summary_list:
+        value_list = [str(summary['config'].get(key, '')) for key in key_list]
+        value_list += ["{0:.4f}".format(summary[key]) for key in ['fitness_avg', 'fitness_std', 'runtime_avg']]
+        value_list += ["{0:.1f}".format(summary['generation_avg']), "{0:.2f}".format(summary['rate_hit'])]
+        value_list += [str(summary['num_error'])]
+        line_list.append("\t".join(value_list))
+
+    try:
+        with open(file_path, mode="w") as f:
+            f.write("\n".join(line_list) + "\n")
+    except:
+        print('[Error] The file can not be written ...')
+        print('[Error] Please check this: ' + str(file_path))
+
+    return line_list
+
+
+# --------------------------------------------------------------------------------
+# 4.Main function
+# --------------------------------------------------------------------------------
+def main_function():
+    net_name = "LFR_benchmark_n=300_u=0.05"
+
+    # --------------------------------------------------
+    # search space: [value, ...] of grid or random search, (min, max) of random search only
+    search_space = {'size_population': [50, 100],
+                    'num_generation': [50],
+                    'rate_selection': [0.1, 0.2],
+                    'rate_crossover': [0.5, 0.8],
+                    'rate_mutation': [0.01, 0.05]}
+    is_random_search = False
+    num_sample = 20
+    num_repeat = 3
+    fitness_target = None  # None: 99% of the best fitness of the sweep
+
+    # --------------------------------------------------
+    print(" Locus-based genetic algorithm (LGA) parameter sweep")
+    print(" - [Net] {0}:".format(net_name))
+    print(" -- Read edge-list file")
+    file_path = "{0}{1}.txt".format(FOLDER_EDGELIST, net_name)
+    g = lga.create_network(eh.read_edgelist(file_path))
+
+    if is_random_search:
+        config_list = generate_random_config(search_space, num_sample, SWEEP_SEED)
+    else:
+        config_list = generate_grid_config(search_space)
+
+    print(" -- Sweep {0} configurations x {1} repeats".format(len(config_list), num_repeat))
+    result_list = parameter_sweep(g, config_list, num_repeat)
+    summary_list, fitness_target = summarize_result(config_list, result_list, fitness_target)
+
+    print(" -- Save sweep result, target fitness {0:.4f}".format(fitness_target))
+    file_path = "{0}{1}-lga-sweep.pickle".format(FOLDER_FILE, net_name)
+    ph.write_pickle_file([config_list, result_list, summary_list], file_path)
+
+    file_path = "{0}{1}, lga-sweep.txt".format(FOLDER_FILE, net_name)
+    for line in write_summary(summary_list, file_path):
+        print(" {0}".format(line))
+    print(" - [/Net]\n")
+
+
+if __name__ == "__main__":
+    main_function()
@@ -0,0 +1,39 @@
+"""
+Label propagation (vectorized, semi-synchronous)
+
+@auth: Yu-Hsiang Fu
+@date: 2026/10/19
+"""
+import numpy as np
+
+
+def label_propagation(indptr, indices, num_sweep=10, rate_update=0.5, random_state=None):
+    """
+    Label propagation on the CSR adjacency index (indptr, indices) of nodes
+    0..N-1. In each sweep, a random rate_update of nodes take the most frequent
+    label of their neighbors (ties are broken at random); the partial update
+    avoids the label oscillation of synchronous propagation.
+    """
+    rs = np.random.RandomState(random_state)
+    num_node = len(indptr) - 1
+    src = np.repeat(np.arange(num_node, dtype=np.int64), np.diff(indptr))
+    labels = np.arange(num_node, dtype=np.int64)
+
+    for s in range(0, num_sweep):
+        # count the (node, neighbor label) pairs
+        pair_key, pair_count = np.unique(src * num_node + labels[indices], return_counts=True)
+        pair_node = pair_key // num_node
+        pair_label = pair_key % num_node
+
+        # the most frequent label of each node, random tie-breaking
+        order = np.lexsort((pair_count + rs.random_sample(len(pair_count)), pair_node))
+        pair_node = pair_node[order]
+        is_last = np.append(pair_node[1:] != pair_node[:-1], True)
+        best_node = pair_node[is_last]
+        best_label = pair_label[order][is_last]
+
+        # semi-synchronous update
+        is_update = rs.random_sample(len(best_node)) < rate_update
+        labels[best_node[is_update]] = best_label[is_update]
+
+    return labels
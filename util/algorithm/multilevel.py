@@ -0,0 +1,222 @@
+"""
+Multilevel: graph coarsening, partition projection and refinement
+
+@auth: Yu-Hsiang Fu
+@date: 2026/10/19
+"""
+import networkx as nx
+import random as r
+
+# import graph-constant
+from util.constant.constant_graph import EDGE_WEIGHT
+from util.constant.constant_graph import GRAPH_TOTAL_WEIGHT
+from util.constant.constant_graph import NODE_DEGREE
+from util.constant.constant_graph import NODE_SELF_WEIGHT
+
+
+# --------------------------------------------------
+# node strength
+# --------------------------------------------------
+def add_node_strength(g):
+    # strength = weighted degree + 2 * weight of the contracted (self) edges
+    for i in g:
+        g.node[i][NODE_DEGREE] = g.degree(i, weight=EDGE_WEIGHT) + 2 * g.node[i].get(NODE_SELF_WEIGHT, 0)
+
+    return g
+
+
+def total_weight(g):
+    return g.graph.get(GRAPH_TOTAL_WEIGHT, g.number_of_edges())
+
+
+# --------------------------------------------------
+# coarsening
+# --------------------------------------------------
+def heavy_edge_matching(g):
+    """
+    Match each node with the unmatched neighbor of the heaviest normalized edge
+    weight w_ij / (k_i * k_j); an unmatched leaf joins its neighbor's group.
+    """
+    node_map = {}
+    coarse_id = 0
+
+    node_order = list(g)
+    r.shuffle(node_order)
+
+    for i in node_order:
+        if i in node_map:
+            continue
+
+        best_j = None
+        best_score = 0
+
+        for (j, edge_attr) in g.adj[i].items():
+            if j in node_map:
+                continue
+
+            score = edge_attr.get(EDGE_WEIGHT, 1) / (g.node[i][NODE_DEGREE] * g.node[j][NODE_DEGREE])
+
+            if score > best_score:
+                best_j = j
+                best_score = score
+
+        if best_j is not None:
+            node_map[i] = coarse_id
+            node_map[best_j] = coarse_id
+            coarse_id += 1
+        elif g.degree(i) == 1:
+            j = next(iter(g[i]))
+
+            if j in node_map:
+                node_map[i] = node_map[j]
+            else:
+                node_map[i] = coarse_id
+                coarse_id += 1
+        else:
+            node_map[i] = coarse_id
+            coarse_id += 1
+
+    return node_map
+
+
+def contract_graph(g, node_map):
+    g_coarse = nx.Graph()
+    g_coarse.graph[GRAPH_TOTAL_WEIGHT] = total_weight(g)
+
+    # coarse node: sum of strength and self-weight, time complexity: O(V)
+    for i in g:
+        ci = node_map[i]
+
+        if ci not in g_coarse:
+            g_coarse.add_node(ci)
+            g_coarse.node[ci][NODE_DEGREE] = 0
+            g_coarse.node[ci][NODE_SELF_WEIGHT] = 0
+
+        g_coarse.node[ci][NODE_DEGREE] += g.node[i][NODE_DEGREE]
+        g_coarse.node[ci][NODE_SELF_WEIGHT] += g.node[i].get(NODE_SELF_WEIGHT, 0)
+
+    # coarse edge: sum of edge weight, time complexity: O(E)
+    for (ei, ej, w) in g.edges(data=EDGE_WEIGHT, default=1):
+        ci = node_map[ei]
+        cj = node_map[ej]
+
+        if ci == cj:
+            g_coarse.node[ci][NODE_SELF_WEIGHT] += w
+        elif g_coarse.has_edge(ci, cj):
+            g_coarse[ci][cj][EDGE_WEIGHT] += w
+        else:
+            g_coarse.add_edge(ci, cj, **{EDGE_WEIGHT: w})
+
+    return g_coarse
+
+
+def coarsen_graph(g, size_coarsest=100, rate_shrink=0.9):
+    """
+    Return the level list [(g_coarse, node_map), ...] from the finest to the
+    coarsest graph; node_map maps nodes of the finer level to the coarse nodes.
+    Coarsening stops at size_coarsest nodes, or when a level keeps more than
+    rate_shrink of the nodes of the previous one.
+    """
+    level_list = []
+    g_fine = g
+
+    while g_fine.number_of_nodes() > size_coarsest:
+        node_map = heavy_edge_matching(g_fine)
+        g_coarse = contract_graph(g_fine, node_map)
+
+        if g_coarse.number_of_edges() == 0:
+            break
+        elif g_coarse.number_of_nodes() > rate_shrink * g_fine.number_of_nodes():
+            break
+        else:
+            pass
+
+        level_list.append((g_coarse, node_map))
+        g_fine = g_coarse
+
+    return level_list
+
+
+# --------------------------------------------------
+# projection and refinement
+# --------------------------------------------------
+def community_to_membership(community_list):
+    membership = {}
+
+    for (community_index, community) in enumerate(community_list):
+        for i in community:
+            membership[i] = community_index
+
+    return membership
+
+
+def membership_to_community(membership):
+    community_list = {}
+
+    for (i, ci) in membership.items():
+        if ci in community_list:
+            community_list[ci].append(i)
+        else:
+            community_list[ci] = [i]
+
+    return list(community_list.values())
+
+
+def project_membership(membership, node_map):
+    return {i: membership[ci] for (i, ci) in node_map.items()}
+
+
+def refine_membership(g, membership, num_sweep=3):
+    """
+    Local moving: move each node to the neighboring community of the largest
+    modularity gain k_i,C - k_i * S_C / 2m, time complexity: O(E) per sweep.
+    """
+    double_weight = 2 * total_weight(g)
+
+    # strength of communities
+    community_strength = {}
+
+    for i in g:
+        ci = membership[i]
+        community_strength[ci] = community_strength.get(ci, 0) + g.node[i][NODE_DEGREE]
+
+    # local moving
+    node_order = list(g)
+
+    for s in range(0, num_sweep):
+        num_move = 0
+        r.shuffle(node_order)
+
+        for i in node_order:
+            ci = membership[i]
+            ki = g.node[i][NODE_DEGREE]
+
+            # edge weight from node i to its neighboring communities
+            neighbor_weight = {}
+
+            for (j, edge_attr) in g.adj[i].items():
+                cj = membership[j]
+                neighbor_weight[cj] = neighbor_weight.get(cj, 0) + edge_attr.get(EDGE_WEIGHT, 1)
+
+            # remove node i from its community, then find the best community
+            community_strength[ci] -= ki
+            best_c = ci
+            best_gain = neighbor_weight.get(ci, 0) - ki * community_strength[ci] / double_weight
+
+            for (cj, w) in neighbor_weight.items():
+                gain = w - ki * community_strength[cj] / double_weight
+
+                if gain > best_gain:
+                    best_c = cj
+                    best_gain = gain
+
+            community_strength[best_c] += ki
+            membership[i] = best_c
+
+            if best_c != ci:
+                num_move += 1
+
+        if num_move == 0:
+            break
+
+    return membership
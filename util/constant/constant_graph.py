@@ -3,11 +3,12 @@ Constant: graph
 
 @auth: Yu-Hsiang Fu
 @date: 2014/09/28
-@update: 2018/03/22
+@update: 2026/10/19
 """
 # node variable
 NODE_COMMUNITY = 'node_community'
 NODE_LAYOUT_XY = 'node_layout-xy'
+NODE_SELF_WEIGHT = 'node_self-weight'
 
 # node attribute
 NODE_BETWEENNESS = 'node_betweenness'
@@ -17,9 +18,13 @@ NODE_DEGREE = 'node_degree'
 NODE_K_SHELL = 'node_k-shell'
 NODE_PAGERANK = 'node_pagerank'
 
+# edge attribute
+EDGE_WEIGHT = 'edge_weight'
+
 # graph attribute
 GRAPH_DEGREE_ASSORTATIVITY = 'graph_degree-assortativity'
 GRAPH_AVG_DEGREE = 'graph_avg-degree'
 GRAPH_AVG_DEGREE_SQUARE = 'graph_avg-degree-square'
 GRAPH_DEGREE_HETEROGENEITY = 'graph_degree-heterogeneity'
 GRAPH_THEORETICAL_THRESHOLD = 'graph_theoretical-threshold'
+GRAPH_TOTAL_WEIGHT = 'graph_total-weight'
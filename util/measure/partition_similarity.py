@@ -0,0 +1,231 @@
+"""
+Measure: partition similarity (NMI, ARI and variation of information)
+
+@auth: Yu-Hsiang Fu
+@date: 2026/10/19
+"""
+import numpy as np
+
+# size limit of a dense contingency table, a larger table is counted by sorting
+CELL_LIMIT = 2 ** 21
+
+
+def community_to_label(community_list, node_index):
+    """
+    Label array of a community list, node_index maps node_id to 0..N-1.
+    """
+    labels = np.zeros(len(node_index), dtype=np.int64)
+
+    for (community_index, community) in enumerate(community_list):
+        labels[[node_index[i] for i in community]] = community_index
+
+    return labels
+
+
+def dense_label(label_matrix):
+    """
+    Relabel each row of label_matrix to 0..K-1, return the labels and K of each
+    row. Non-negative int labels below 2N are mapped through a table of the
+    present labels in O(P * N) without sorting, other labels by np.unique.
+    """
+    label_matrix = np.atleast_2d(label_matrix)
+    num_row, num_node = label_matrix.shape
+
+    if label_matrix.dtype.kind not in 'iu' or label_matrix.min() < 0 or label_matrix.max() >= 2 * num_node:
+        label_list = [np.unique(labels, return_inverse=True)[1] for labels in label_matrix]
+        return np.array(label_list, dtype=np.int64).reshape(num_row, num_node), \
+            np.array([labels.max() + 1 for labels in label_list], dtype=np.int64)
+
+    # rank of each present label within its row
+    num_label_max = int(label_matrix.max()) + 1
+    label_key = label_matrix.astype(np.int64) + np.arange(num_row, dtype=np.int64)[:, None] * num_label_max
+    is_present = np.zeros(num_row * num_label_max, dtype=bool)
+    is_present[label_key.ravel()] = True
+
+    num_label = is_present.reshape(num_row, num_label_max).sum(axis=1)
+    label_rank = np.cumsum(is_present) - 1
+    rank_start = np.concatenate(([0], np.cumsum(num_label)[:-1]))
+
+    return label_rank[label_key] - rank_start[:, None], num_label
+
+
+def label_count(label_matrix, num_label):
+    # label counts of the dense rows, padded with 0 to the largest K
+    num_row = label_matrix.shape[0]
+    num_label_max = int(num_label.max())
+    count = np.bincount((label_matrix + np.arange(num_row, dtype=np.int64)[:, None] * num_label_max).ravel(),
+                        minlength=num_row * num_label_max)
+
+    return count.reshape(num_row, num_label_max)
+
+
+def pair_contingency_statistic(label_matrix, num_label, pair_x, pair_y):
+    """
+    Statistics of the contingency tables between the rows pair_x[k] and
+    pair_y[k] of the dense label_matrix (see dense_label). The cells are counted
+    by np.bincount over the keys x * K_y + y without sorting; if the tables are
+    larger than the keys, the nodes of a cell share one representative, found by
+    writing and reading a table of the keys. The pairs are processed in blocks of
+    about CELL_LIMIT keys, time complexity: O(N) per pair; a table larger than
+    CELL_LIMIT is counted by np.unique.
+    """
+    num_node = label_matrix.shape[1]
+    num_pair = len(pair_x)
+    count_matrix = label_count(label_matrix, num_label)
+    cell_size = num_label[pair_x] * num_label[pair_y]
+    cell_pair = []
+    cell_local = []
+    cell_count = []
+
+    # joint counts n_ij of the dense tables, a block of pairs shares one key table of int32 keys
+    key_table = None
+    label_matrix = label_matrix.astype(np.int32)
+    dense_pair = np.flatnonzero(cell_size <= CELL_LIMIT)
+    dense_block = np.cumsum(np.maximum(cell_size[dense_pair], num_node)) // CELL_LIMIT
+
+    for block in np.unique(dense_block):
+        block_pair = dense_pair[dense_block == block]
+        block_offset = np.concatenate(([0], np.cumsum(cell_size[block_pair])[:-1]))
+        block_key = label_matrix[pair_x[block_pair]] * num_label[pair_y[block_pair]][:, None].astype(np.int32) \
+            + label_matrix[pair_y[block_pair]] + block_offset[:, None].astype(np.int32)
+        block_key = block_key.ravel()
+
+        if cell_size[block_pair].sum() <= len(block_key):
+            # small tables, count the keys directly
+            block_count = np.bincount(block_key, minlength=cell_size[block_pair].sum())
+            block_cell = np.flatnonzero(block_count)
+            k = np.searchsorted(block_offset, block_cell, side='right') - 1
+
+            cell_pair.append(block_pair[k])
+            cell_local.append(block_cell - block_offset[k])
+            cell_count.append(block_count[block_cell])
+        else:
+            # large tables, the nodes of a cell share one representative
+            key_table = np.empty(2 * CELL_LIMIT, dtype=np.int32) if key_table is None else key_table
+            node_index = np.arange(len(block_key), dtype=np.int32)
+            key_table[block_key] = node_index
+            representative = key_table[block_key]
+            is_representative = np.flatnonzero(representative == node_index)
+            k = is_representative // num_node
+
+            cell_pair.append(block_pair[k])
+            cell_local.append(block_key[is_representative] - block_offset[k])
+            cell_count.append(np.bincount(representative, minlength=len(block_key))[is_representative])
+
+    for k in np.flatnonzero(cell_size > CELL_LIMIT):
+        pair_key = label_matrix[pair_x[k]] * num_label[pair_y[k]] + label_matrix[pair_y[k]]
+        pair_key, pair_count = np.unique(pair_key, return_counts=True)
+        cell_pair.append(np.full(len(pair_key), k, dtype=np.int64))
+        cell_local.append(pair_key)
+        cell_count.append(pair_count)
+
+    cell_pair = np.concatenate(cell_pair)
+    cell_local = np.concatenate(cell_local)
+    cell_count = np.concatenate(cell_count)
+    cell_x = cell_local // num_label[pair_y[cell_pair]]
+    cell_y = cell_local % num_label[pair_y[cell_pair]]
+
+    # mutual information
+    n = float(num_node)
+    a_i = count_matrix[pair_x[cell_pair], cell_x]
+    b_j = count_matrix[pair_y[cell_pair], cell_y]
+    p_ij = cell_count / n
+    mutual_information = np.bincount(cell_pair, weights=p_ij * np.log(n * cell_count / (a_i * b_j)), minlength=num_pair)
+
+    # entropy and pair counts of each row, pair counts of ARI
+    p_row = count_matrix / n
+    entropy = -np.sum(p_row * np.log(np.where(p_row > 0, p_row, 1)), axis=1)
+    pair_row = np.sum(count_matrix * (count_matrix - 1) / 2, axis=1)
+    pair_ij = np.bincount(cell_pair, weights=cell_count * (cell_count - 1) / 2, minlength=num_pair)
+
+    return {'mutual_information': mutual_information,
+            'entropy_x': entropy[pair_x],
+            'entropy_y': entropy[pair_y],
+            'pair_ij': pair_ij,
+            'pair_x': pair_row[pair_x],
+            'pair_y': pair_row[pair_y],
+            'pair_all': n * (n - 1) / 2}
+
+
+def contingency_statistic(labels_x, label_matrix):
+    """
+    Statistics of the contingency tables between labels_x and each row of
+    label_matrix.
+    """
+    label_matrix, num_label = dense_label(np.vstack((labels_x, np.atleast_2d(label_matrix))))
+    pair_y = np.arange(1, label_matrix.shape[0])
+
+    return pair_contingency_statistic(label_matrix, num_label, np.zeros_like(pair_y), pair_y)
+
+
+def nmi_from_statistic(stat):
+    # NMI = 2 * I(X; Y) / (H(X) + H(Y)), both trivial partitions are identical
+    entropy_sum = stat['entropy_x'] + stat['entropy_y']
+    return np.where(entropy_sum > 0, 2 * stat['mutual_information'] / np.where(entropy_sum > 0, entropy_sum, 1), 1.0)
+
+
+def ari_from_statistic(stat):
+    # ARI = (sum_ij - expected) / (mean of sum_i and sum_j - expected)
+    expected = stat['pair_x'] * stat['pair_y'] / stat['pair_all']
+    maximum = (stat['pair_x'] + stat['pair_y']) / 2
+    return np.where(maximum > expected,
+                    (stat['pair_ij'] - expected) / np.where(maximum > expected, maximum - expected, 1),
+                    1.0)
+
+
+def vi_from_statistic(stat):
+    # VI = H(X) + H(Y) - 2 * I(X; Y)
+    return np.maximum(stat['entropy_x'] + stat['entropy_y'] - 2 * stat['mutual_information'], 0)
+
+
+# --------------------------------------------------
+# partition pair
+# --------------------------------------------------
+def normalized_mutual_information(labels_x, labels_y):
+    return float(nmi_from_statistic(contingency_statistic(labels_x, labels_y))[0])
+
+
+def adjusted_rand_index(labels_x, labels_y):
+    return float(ari_from_statistic(contingency_statistic(labels_x, labels_y))[0])
+
+
+def variation_of_information(labels_x, labels_y):
+    return float(vi_from_statistic(contingency_statistic(labels_x, labels_y))[0])
+
+
+# --------------------------------------------------
+# population
+# --------------------------------------------------
+def pairwise_nmi(label_matrix):
+    """
+    P x P NMI matrix of the rows of label_matrix, all pairs in blocks.
+    """
+    label_matrix, num_label = dense_label(label_matrix)
+    num_row = label_matrix.shape[0]
+    nmi_matrix = np.ones((num_row, num_row))
+
+    if num_row > 1:
+        pair_x, pair_y = np.triu_indices(num_row, 1)
+        nmi_matrix[pair_x, pair_y] = nmi_from_statistic(pair_contingency_statistic(label_matrix,
+                                                                                    num_label,
+                                                                                    pair_x,
+                                                                                    pair_y))
+        nmi_matrix[pair_y, pair_x] = nmi_matrix[pair_x, pair_y]
+
+    return nmi_matrix
+
+
+def population_diversity(label_matrix):
+    """
+    Mean pairwise NMI distance (1 - NMI) of a population, 0 if all partitions
+    are identical; duplicated partitions are compared once.
+    """
+    label_matrix, count = np.unique(np.asarray(label_matrix), axis=0, return_counts=True)
+
+    if label_matrix.shape[0] == 1:
+        return 0.0
+
+    distance = 1 - pairwise_nmi(label_matrix)
+    num_pair = count.sum() * (count.sum() - 1)
+
+    return float(count @ distance @ count / num_pair)